@@ -11,13 +11,15 @@ Visit <https://github.com/wheelodex/entry-points-txt> for more information.
 """
 
 from __future__ import annotations
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from importlib import import_module
 from io import StringIO
 from keyword import iskeyword
+import os
 import re
-from typing import Any, IO
+import sys
+from typing import TYPE_CHECKING, Any, IO
 
 __version__ = "0.3.0"
 __author__ = "John Thorvald Wodder II"
@@ -28,13 +30,21 @@ __url__ = "https://github.com/wheelodex/entry-points-txt"
 __all__ = [
     "EntryPoint",
     "EntryPointSet",
+    "EntryPointTuple",
+    "IncrementalParser",
     "ParseError",
     "dump",
     "dump_list",
     "dumps",
     "dumps_list",
     "load",
+    "load_tuples",
     "loads",
+    "loads_tuples",
+    "scan_environment",
+    "validate_dotted_names",
+    "validate_extras",
+    "validate_group_names",
 ]
 
 
@@ -79,8 +89,44 @@ class EntryPoint:
 
 EntryPointSet = dict[str, dict[str, EntryPoint]]
 
-GROUP_RGX = re.compile(r"\w+(?:\.\w+)*")
-EXTRA_RGX = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?")
+#: A lightweight representation of an entry point as a plain tuple of the
+#: fields of `EntryPoint`, in the same order
+EntryPointTuple = tuple[str, str, str, str | None, tuple[str, ...]]
+
+
+# `GROUP_RGX` and `EXTRA_RGX` are compiled on first use (via the module-level
+# `__getattr__()`) rather than at import time.  Each is stored in a global once
+# compiled; if two threads race to compile one, both produce equal patterns, so
+# no lock is needed.
+if TYPE_CHECKING:
+    GROUP_RGX: re.Pattern[str]
+    EXTRA_RGX: re.Pattern[str]
+
+_GROUP_RGX: re.Pattern[str] | None = None
+_EXTRA_RGX: re.Pattern[str] | None = None
+
+
+def __getattr__(name: str) -> Any:
+    if name == "GROUP_RGX":
+        return _group_rgx()
+    elif name == "EXTRA_RGX":
+        return _extra_rgx()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _group_rgx() -> re.Pattern[str]:
+    global _GROUP_RGX
+    if _GROUP_RGX is None:
+        _GROUP_RGX = re.compile(r"\w+(?:\.\w+)*")
+    return _GROUP_RGX
+
+
+def _extra_rgx() -> re.Pattern[str]:
+    global _EXTRA_RGX
+    if _EXTRA_RGX is None:
+        _EXTRA_RGX = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?")
+    return _EXTRA_RGX
 
 
 def load(fp: IO[str]) -> EntryPointSet:
@@ -135,21 +181,153 @@ def load(fp: IO[str]) -> EntryPointSet:
     """
 
     eps: EntryPointSet = {}
-    group = None
+    parser = _LineParser()
+    for line in fp:
+        t = parser.parse_line(line)
+        if t is not None:
+            eps.setdefault(t[0], {})[t[1]] = EntryPoint(*t)
+    return eps
+
+
+def loads(s: str) -> EntryPointSet:
+    """Like `load()`, but reads from a string instead of a filehandle"""
+    return load(StringIO(s))
+
+
+def load_tuples(fp: IO[str]) -> Iterator[EntryPointTuple]:
+    """
+    Parse a file-like object as an :file:`entry_points.txt`-format file and
+    yield each entry point as a plain tuple of ``(group, name, module, attr,
+    extras)``, in the order in which they appear.  Unlike `load()`, this does
+    not construct `EntryPoint` objects, making it somewhat cheaper for bulk
+    processing; a tuple ``t`` can be converted to an `EntryPoint` with
+    ``EntryPoint(*t)``.  Only the `EntryPoint` objects are saved; the
+    intermediate strings created while splitting each line are the same as
+    for `load()`.  Entry points with duplicate group & name are all yielded.
+    """
+    parser = _LineParser()
     for line in fp:
+        t = parser.parse_line(line)
+        if t is not None:
+            yield t
+
+
+def loads_tuples(s: str) -> Iterator[EntryPointTuple]:
+    """
+    Like `load_tuples()`, but reads from a string instead of a filehandle
+    """
+    return load_tuples(StringIO(s))
+
+
+class IncrementalParser:
+    """
+    A push-style parser for :file:`entry_points.txt`-format input that arrives
+    in arbitrarily-sized chunks (e.g., from a pipe or socket).  Pass each chunk
+    of text to `feed()`, which returns the `EntryPoint` objects for all lines
+    completed so far, and call `close()` once the input is exhausted in order
+    to parse any final unterminated line.  Only the current incomplete line is
+    buffered between calls.
+
+    Input must be `str`; to parse bytes, decode them first with a decoder from
+    `codecs.getincrementaldecoder()` so that multibyte characters split across
+    chunks are handled correctly.
+
+    If a line is invalid, `feed()` or `close()` raises a `ParseError`, and the
+    parser remains usable as though the invalid line had been omitted: entry
+    points parsed from earlier lines in the same call are returned by the next
+    call to `feed()` or `close()`, and any lines after the invalid one are
+    parsed then as well.  Callers that want to stop at the first error can
+    simply discard the parser.
+    """
+
+    def __init__(self) -> None:
+        self._parser = _LineParser()
+        self._buf: list[str] = []
+        #: Entry points parsed before an error that have not been returned yet
+        self._pending: list[EntryPoint] = []
+        #: Whether `_buf` may contain complete lines left over after an error
+        self._resume = False
+
+    def feed(self, data: str) -> list[EntryPoint]:
+        """
+        Parse a chunk of input and return the entry points on all lines
+        completed by it (plus any left over from a previous call that raised
+        an error), in order.  Raises `ParseError` on invalid input.
+        """
+        if "\n" not in data and not (self._resume or self._pending):
+            if data:
+                self._buf.append(data)
+            return []
+        self._buf.append(data)
+        buf = "".join(self._buf)
+        eps = self._pending
+        self._pending = []
+        self._resume = False
+        start = 0
+        while (end := buf.find("\n", start)) != -1:
+            line = buf[start:end]
+            start = end + 1
+            try:
+                t = self._parser.parse_line(line)
+            except ParseError:
+                self._buf = [buf[start:]]
+                self._pending = eps
+                self._resume = True
+                raise
+            if t is not None:
+                eps.append(EntryPoint(*t))
+        self._buf = [buf[start:]] if start < len(buf) else []
+        return eps
+
+    def close(self) -> list[EntryPoint]:
+        """
+        Signal the end of input and return the entry points on all remaining
+        lines, including the final line if it was not terminated by a newline.
+        Raises `ParseError` on invalid input.
+        """
+        eps = self.feed("")
+        line = "".join(self._buf)
+        self._buf = []
+        try:
+            t = self._parser.parse_line(line)
+        except ParseError:
+            self._pending = eps
+            raise
+        if t is not None:
+            eps.append(EntryPoint(*t))
+        return eps
+
+
+class _LineParser:
+    """
+    The line-by-line grammar of :file:`entry_points.txt`, shared by `load()`,
+    `load_tuples()`, and `IncrementalParser`.  The only state kept between
+    lines is the current group.
+    """
+
+    def __init__(self) -> None:
+        self.group: str | None = None
+
+    def parse_line(self, line: str) -> EntryPointTuple | None:
+        """
+        Parse a single line of input, returning an `EntryPointTuple` if the
+        line defines an entry point or `None` otherwise
+        """
         line = line.strip()
         if not line or line.startswith(("#", ";")):
-            continue
+            return None
         if line.startswith("["):
             if not line.endswith("]"):
                 raise ParseError("Group header missing closing bracket")
             group = line[1:-1].strip()
             if not group:
                 raise ParseError("Empty group name")
-            if not GROUP_RGX.fullmatch(group):
+            if not _group_rgx().fullmatch(group):
                 raise ParseError(f"Invalid group name: {group!r}")
+            self.group = group
+            return None
         else:
-            if group is None:
+            if self.group is None:
                 raise ParseError("Entry point line occurs before any group headers")
             name, eq, spec = line.partition("=")
             if not eq:
@@ -182,26 +360,15 @@ def load(fp: IO[str]) -> EntryPointSet:
                 extrastr = extrastr.strip()
                 if extrastr:
                     extras = tuple(e.strip() for e in extrastr.split(","))
+                    rgx = _extra_rgx()
                     for e in extras:
-                        if not EXTRA_RGX.fullmatch(e):
+                        if not rgx.fullmatch(e):
                             raise ParseError(f"Invalid extra: {e!r}")
                 else:
                     extras = ()
             else:
                 extras = ()
-            eps.setdefault(group, {})[name] = EntryPoint(
-                group=group,
-                name=name,
-                module=module,
-                attr=objname,
-                extras=extras,
-            )
-    return eps
-
-
-def loads(s: str) -> EntryPointSet:
-    """Like `load()`, but reads from a string instead of a filehandle"""
-    return load(StringIO(s))
+            return (self.group, name, module, objname, extras)
 
 
 def dump(eps: EntryPointSet, fp: IO[str]) -> None:
@@ -263,6 +430,230 @@ def dumps_list(eps: Iterable[EntryPoint]) -> str:
     return dumps(epset)
 
 
+def scan_environment(
+    paths: str | os.PathLike[str] | Iterable[str | os.PathLike[str]] | None = None,
+    cache: str | os.PathLike[str] | None = None,
+    on_error: Callable[[str, ParseError], None] | None = None,
+) -> dict[str, EntryPointSet]:
+    """
+    Find & parse the :file:`entry_points.txt` files of all distributions
+    installed as :file:`*.dist-info` directories in the given directory or
+    directories (default: `sys.path`) and return a `dict` mapping each distribution name
+    to its entry points.  Distributions without an :file:`entry_points.txt`
+    file are omitted.  If the same distribution is installed in more than one
+    directory, only the first one found is used, as with `importlib.metadata`.
+
+    If ``cache`` is given, it is used as the path to a JSON file in which the
+    parsed entry points are stored along with each :file:`entry_points.txt`
+    file's modification time & size.  On subsequent calls, files whose
+    modification time & size have not changed are not parsed again.  Entries
+    are keyed by absolute path, and entries for directories not scanned by a
+    given call are left in place, so one cache file may be shared by calls
+    with different ``paths``.
+
+    If an :file:`entry_points.txt` file is invalid, a `ParseError` is raised
+    with the path to the file at the start of its message.  Alternatively, if
+    ``on_error`` is given, it is called with the path to the file and the
+    `ParseError`, and the distribution is omitted from the results.
+    """
+    if paths is None:
+        paths = sys.path
+    elif isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    cached: dict[str, Any] = {}
+    if cache is not None:
+        cached = _read_scan_cache(cache)
+    new_cache: dict[str, Any] = {}
+    scanned: set[str] = set()
+    seen: set[str] = set()
+    result: dict[str, EntryPointSet] = {}
+    for path in paths:
+        try:
+            entries = sorted(os.scandir(path or "."), key=lambda e: e.name)
+        except OSError:
+            continue
+        scanned.add(os.path.abspath(path or "."))
+        for entry in entries:
+            if not entry.name.endswith(".dist-info"):
+                continue
+            name = entry.name[: -len(".dist-info")].partition("-")[0]
+            key = name.lower().replace("-", "_").replace(".", "_")
+            if key in seen:
+                continue
+            epfile = os.path.join(entry.path, "entry_points.txt")
+            try:
+                st = os.stat(epfile)
+            except OSError:
+                if entry.is_dir():
+                    seen.add(key)
+                continue
+            seen.add(key)
+            stamp = [st.st_mtime_ns, st.st_size]
+            cache_key = os.path.abspath(epfile)
+            hit = cached.get(cache_key)
+            eps: EntryPointSet | None = None
+            if isinstance(hit, dict) and hit.get("stamp") == stamp:
+                try:
+                    eps = _eps_from_scan_cache(hit["entry_points"])
+                except (KeyError, TypeError, ValueError):
+                    # Malformed cache entry; reparse the file
+                    pass
+                else:
+                    new_cache[cache_key] = hit
+            if eps is None:
+                try:
+                    with open(epfile, encoding="utf-8") as fp:
+                        eps = load(fp)
+                except ParseError as e:
+                    if on_error is None:
+                        raise ParseError(f"{epfile}: {e}") from e
+                    on_error(epfile, e)
+                    continue
+                new_cache[cache_key] = {
+                    "stamp": stamp,
+                    "entry_points": [
+                        [ep.group, ep.name, ep.module, ep.attr, list(ep.extras)]
+                        for group in eps.values()
+                        for ep in group.values()
+                    ],
+                }
+            result[name] = eps
+    if cache is not None:
+        # Keep entries for directories that were not scanned this time so that
+        # one cache file can be shared by calls with different paths
+        for k, v in cached.items():
+            sitedir = os.path.dirname(os.path.dirname(k))
+            if k not in new_cache and sitedir not in scanned:
+                new_cache[k] = v
+        if new_cache != cached:
+            _write_scan_cache(cache, new_cache)
+    return result
+
+
+def _eps_from_scan_cache(records: Any) -> EntryPointSet:
+    """
+    Convert a list of entry point records from a `scan_environment()` cache
+    entry into an `EntryPointSet`, raising `ValueError` if the records are
+    malformed
+    """
+    if not isinstance(records, list):
+        raise ValueError("Cached entry points are not a list")
+    eps: EntryPointSet = {}
+    for rec in records:
+        if not (
+            isinstance(rec, list)
+            and len(rec) == 5
+            and all(isinstance(f, str) for f in rec[:3])
+            and (rec[3] is None or isinstance(rec[3], str))
+            and isinstance(rec[4], list)
+            and all(isinstance(e, str) for e in rec[4])
+        ):
+            raise ValueError(f"Malformed cached entry point: {rec!r}")
+        group, name, module, attr, extras = rec
+        eps.setdefault(group, {})[name] = EntryPoint(
+            group=group,
+            name=name,
+            module=module,
+            attr=attr,
+            extras=tuple(extras),
+        )
+    return eps
+
+
+def _read_scan_cache(path: str | os.PathLike[str]) -> dict[str, Any]:
+    """
+    Read a cache file written by `scan_environment()`, returning an empty
+    `dict` if it does not exist or cannot be read
+    """
+    import json
+
+    try:
+        with open(path, encoding="utf-8") as fp:
+            data = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != 1:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _write_scan_cache(path: str | os.PathLike[str], files: dict[str, Any]) -> None:
+    """
+    Atomically write the cache file for `scan_environment()`, ignoring any
+    errors
+    """
+    import json
+    import tempfile
+
+    dirpath = os.path.dirname(os.path.abspath(path))
+    try:
+        fd, tmp = tempfile.mkstemp(dir=dirpath, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with open(fd, "w", encoding="utf-8") as fp:
+            json.dump({"version": 1, "files": files}, fp)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def validate_group_names(names: Iterable[str]) -> tuple[list[bool], list[int]]:
+    """
+    Test whether each string in ``names`` is a valid entry point group name.
+    Returns a pair of a list of the results in the same order as the input and
+    a list of the (zero-based) indices of the invalid strings.  Each distinct
+    string is only checked once, making this suitable for validating large
+    batches of values with many repeats.
+    """
+    rgx = _group_rgx()
+    return _validate_many(names, lambda s: rgx.fullmatch(s) is not None)
+
+
+def validate_dotted_names(names: Iterable[str]) -> tuple[list[bool], list[int]]:
+    """
+    Like `validate_group_names()`, but tests whether each string in ``names``
+    is a valid dotted sequence of Python identifiers (as required for the
+    module and attribute portions of an entry point)
+    """
+    return _validate_many(names, _is_dotted_id)
+
+
+def validate_extras(extras: Iterable[str]) -> tuple[list[bool], list[int]]:
+    """
+    Like `validate_group_names()`, but tests whether each string in ``extras``
+    is a valid extra name
+    """
+    rgx = _extra_rgx()
+    return _validate_many(extras, lambda s: rgx.fullmatch(s) is not None)
+
+
+def _validate_many(
+    values: Iterable[str], pred: Callable[[str], bool]
+) -> tuple[list[bool], list[int]]:
+    """
+    Apply ``pred`` to each element of ``values``, evaluating it only once per
+    distinct value, and return a list of the results along with a list of the
+    indices at which ``pred`` returned false
+    """
+    seen: dict[str, bool] = {}
+    results: list[bool] = []
+    errors: list[int] = []
+    for i, v in enumerate(values):
+        try:
+            ok = seen[v]
+        except KeyError:
+            ok = seen[v] = pred(v)
+        results.append(ok)
+        if not ok:
+            errors.append(i)
+    return results, errors
+
+
 def _is_dotted_id(s: str) -> bool:
     """
     Tests whether the given string is a valid dotted sequence of Python
@@ -272,6 +663,9 @@ def _is_dotted_id(s: str) -> bool:
 
 
 class ParseError(ValueError):
-    """Exception raised by `load()` or `loads()` when given invalid input"""
+    """
+    Exception raised by the parsing functions & `IncrementalParser` when given
+    invalid input
+    """
 
     pass
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+from typing import get_type_hints
+import pytest
+import entry_points_txt
+
+# Modules that `entry_points_txt` may import beyond those pulled in by its
+# unavoidable dependencies
+ALLOWED = {"__future__", "entry_points_txt"}
+
+
+def imported_modules(code: str) -> set[str]:
+    r = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in r.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rpartition("|")[2].strip()
+            if name != "imported package":
+                modules.add(name)
+    return modules
+
+
+def test_import_modules() -> None:
+    baseline = imported_modules("import dataclasses, importlib, io, keyword, re, typing")
+    modules = imported_modules("import entry_points_txt")
+    assert modules - baseline <= ALLOWED
+
+
+def test_lazy_regexes() -> None:
+    r = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import entry_points_txt;"
+            " print(entry_points_txt._GROUP_RGX);"
+            " print(entry_points_txt.GROUP_RGX.pattern)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert r.stdout.splitlines() == ["None", r"\w+(?:\.\w+)*"]
+
+
+def test_missing_attribute() -> None:
+    with pytest.raises(AttributeError):
+        entry_points_txt.NONEXISTENT  # noqa: B018
+
+
+def test_type_hints_resolve() -> None:
+    # The public API's annotations must remain resolvable at runtime.
+    for obj in [
+        entry_points_txt.EntryPoint,
+        entry_points_txt.EntryPoint.load,
+        entry_points_txt.load,
+        entry_points_txt.load_tuples,
+        entry_points_txt.scan_environment,
+        entry_points_txt.validate_group_names,
+    ]:
+        get_type_hints(obj)
@@ -0,0 +1,70 @@
+import pytest
+from entry_points_txt import EntryPoint, IncrementalParser, ParseError
+
+TXT = (
+    "[console_scripts]\n"
+    "foo = package.__main__:main\n"
+    "bar = package.cli:klass.attr\n"
+    "\n"
+    "# A comment\n"
+    "[thingy.extension]\n"
+    "quux = package.thingy [xtr]"
+)
+
+EPS = [
+    EntryPoint("console_scripts", "foo", "package.__main__", "main", ()),
+    EntryPoint("console_scripts", "bar", "package.cli", "klass.attr", ()),
+    EntryPoint("thingy.extension", "quux", "package.thingy", None, ("xtr",)),
+]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 16, 1000])
+def test_incremental_chunks(size: int) -> None:
+    parser = IncrementalParser()
+    eps = []
+    for i in range(0, len(TXT), size):
+        eps.extend(parser.feed(TXT[i : i + size]))
+    eps.extend(parser.close())
+    assert eps == EPS
+
+
+def test_incremental_emits_early() -> None:
+    parser = IncrementalParser()
+    assert parser.feed("[console_scripts]\nfoo = package.__main__") == []
+    assert parser.feed(":main\nbar") == [EPS[0]]
+    assert parser.feed("") == []
+    assert parser.feed(" = package.cli:klass.attr\r\n") == [EPS[1]]
+    assert parser.close() == []
+
+
+def test_incremental_error() -> None:
+    parser = IncrementalParser()
+    assert parser.feed("[console_scripts]\nfoo = bar:baz[xtr") == []
+    with pytest.raises(ParseError) as excinfo:
+        parser.close()
+    assert str(excinfo.value) == "Extras missing closing bracket"
+
+
+def test_incremental_error_recovery() -> None:
+    parser = IncrementalParser()
+    with pytest.raises(ParseError) as excinfo:
+        parser.feed("[g]\na = b\nc = d[\ne = f\nx = y")
+    assert str(excinfo.value) == "Extras missing closing bracket"
+    assert parser.feed("\n") == [
+        EntryPoint("g", "a", "b", None, ()),
+        EntryPoint("g", "e", "f", None, ()),
+        EntryPoint("g", "x", "y", None, ()),
+    ]
+    assert parser.close() == []
+
+
+def test_incremental_error_recovery_close() -> None:
+    parser = IncrementalParser()
+    assert parser.feed("[g]\n") == []
+    with pytest.raises(ParseError) as excinfo:
+        parser.feed("c = \ne = f\ng = ")
+    assert str(excinfo.value) == "Empty module name"
+    with pytest.raises(ParseError) as excinfo:
+        parser.close()
+    assert str(excinfo.value) == "Empty module name"
+    assert parser.close() == [EntryPoint("g", "e", "f", None, ())]
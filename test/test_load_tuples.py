@@ -0,0 +1,41 @@
+from io import StringIO
+import pytest
+from entry_points_txt import EntryPoint, ParseError, load_tuples, loads, loads_tuples
+
+TXT = (
+    "[console_scripts]\n"
+    "foo = package.__main__:main\n"
+    "bar = package.cli:klass.attr\n"
+    "foo = package.other\n"
+    "\n"
+    "[thingy.extension]\n"
+    "quux = package.thingy [xtr, b-c]\n"
+)
+
+TUPLES = [
+    ("console_scripts", "foo", "package.__main__", "main", ()),
+    ("console_scripts", "bar", "package.cli", "klass.attr", ()),
+    ("console_scripts", "foo", "package.other", None, ()),
+    ("thingy.extension", "quux", "package.thingy", None, ("xtr", "b-c")),
+]
+
+
+def test_loads_tuples() -> None:
+    assert list(loads_tuples(TXT)) == TUPLES
+
+
+def test_load_tuples() -> None:
+    assert list(load_tuples(StringIO(TXT))) == TUPLES
+
+
+def test_tuples_to_entry_points() -> None:
+    eps: dict[str, dict[str, EntryPoint]] = {}
+    for t in loads_tuples(TXT):
+        eps.setdefault(t[0], {})[t[1]] = EntryPoint(*t)
+    assert eps == loads(TXT)
+
+
+def test_loads_tuples_error() -> None:
+    with pytest.raises(ParseError) as excinfo:
+        list(loads_tuples("foo = bar\n"))
+    assert str(excinfo.value) == "Entry point line occurs before any group headers"
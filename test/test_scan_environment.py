@@ -0,0 +1,167 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+import pytest
+from entry_points_txt import EntryPoint, ParseError, scan_environment
+
+
+def mkdist(path: Path, dirname: str, entry_points: str | None) -> Path:
+    distinfo = path / dirname
+    distinfo.mkdir(parents=True)
+    (distinfo / "METADATA").write_text("Metadata-Version: 2.1\n")
+    epfile = distinfo / "entry_points.txt"
+    if entry_points is not None:
+        epfile.write_text(entry_points)
+    return epfile
+
+
+def test_scan_environment(tmp_path: Path) -> None:
+    site1 = tmp_path / "site1"
+    site2 = tmp_path / "site2"
+    mkdist(site1, "foo-1.0.dist-info", "[console_scripts]\nfoo = foo.cli:main\n")
+    mkdist(site1, "bar-2.0.dist-info", None)
+    mkdist(site1, "not_a_dist", "[console_scripts]\nx = y\n")
+    mkdist(site2, "foo-0.9.dist-info", "[console_scripts]\nold = foo:main\n")
+    mkdist(site2, "bar-2.0.dist-info", "[console_scripts]\nbar = bar:main\n")
+    mkdist(site2, "baz-3.0.dist-info", "[baz.plugins]\nq = baz.q [xtr]\n")
+    assert scan_environment([site1, site2, tmp_path / "nonexistent"]) == {
+        "foo": {
+            "console_scripts": {
+                "foo": EntryPoint("console_scripts", "foo", "foo.cli", "main", ()),
+            },
+        },
+        "baz": {
+            "baz.plugins": {
+                "q": EntryPoint("baz.plugins", "q", "baz.q", None, ("xtr",)),
+            },
+        },
+    }
+
+
+@pytest.mark.parametrize("as_str", [False, True])
+def test_scan_environment_single_path(tmp_path: Path, as_str: bool) -> None:
+    mkdist(tmp_path, "foo-1.0.dist-info", "[console_scripts]\nfoo = foo:main\n")
+    result = scan_environment(str(tmp_path) if as_str else tmp_path)
+    assert list(result) == ["foo"]
+
+
+def test_scan_environment_cache(tmp_path: Path) -> None:
+    site = tmp_path / "site"
+    cache = tmp_path / "cache.json"
+    epfile = mkdist(site, "foo-1.0.dist-info", "[console_scripts]\nfoo = foo:main\n")
+    expected = {
+        "foo": {
+            "console_scripts": {
+                "foo": EntryPoint("console_scripts", "foo", "foo", "main", ()),
+            },
+        },
+    }
+    assert scan_environment([site], cache=cache) == expected
+    assert str(epfile) in json.loads(cache.read_text())["files"]
+    # Replace the file with different contents of the same size and mtime; the
+    # cached results should be used.
+    st = epfile.stat()
+    epfile.write_text("[console_scripts]\nfoo = bar:main\n")
+    os.utime(epfile, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert scan_environment([site], cache=cache) == expected
+    # Changing the size invalidates the cache entry.
+    epfile.write_text("[console_scripts]\nfoo = quux:main\n")
+    assert scan_environment([site], cache=cache) == {
+        "foo": {
+            "console_scripts": {
+                "foo": EntryPoint("console_scripts", "foo", "quux", "main", ()),
+            },
+        },
+    }
+
+
+def test_scan_environment_cache_shared(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = tmp_path / "cache.json"
+    site1 = tmp_path / "site1"
+    site2 = tmp_path / "site2"
+    ep1 = mkdist(site1, "foo-1.0.dist-info", "[console_scripts]\nfoo = foo:main\n")
+    ep2 = mkdist(site2, "bar-1.0.dist-info", "[console_scripts]\nbar = bar:main\n")
+    monkeypatch.chdir(site1)
+    assert list(scan_environment([""], cache=cache)) == ["foo"]
+    assert list(scan_environment([site2], cache=cache)) == ["bar"]
+    assert sorted(json.loads(cache.read_text())["files"]) == sorted(
+        [str(ep1), str(ep2)]
+    )
+    # Removing a distribution from a scanned directory drops its entry.
+    (ep2.parent / "entry_points.txt").unlink()
+    assert scan_environment([site2], cache=cache) == {}
+    assert list(json.loads(cache.read_text())["files"]) == [str(ep1)]
+
+
+def test_scan_environment_bad_cache(tmp_path: Path) -> None:
+    site = tmp_path / "site"
+    cache = tmp_path / "cache.json"
+    cache.write_text("not json")
+    mkdist(site, "foo-1.0.dist-info", "[console_scripts]\nfoo = foo:main\n")
+    assert list(scan_environment([site], cache=cache)) == ["foo"]
+    assert json.loads(cache.read_text())["version"] == 1
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        {"stamp": None},
+        {"stamp": None, "entry_points": "abcde"},
+        {"stamp": None, "entry_points": [["console_scripts", "foo"]]},
+        {"stamp": None, "entry_points": [[1, 2, 3, 4, 5]]},
+        {"stamp": None, "entry_points": [["a", "b", "c", None, "xtr"]]},
+    ],
+)
+def test_scan_environment_corrupt_cache_entry(
+    tmp_path: Path, entry: dict[str, Any]
+) -> None:
+    site = tmp_path / "site"
+    cache = tmp_path / "cache.json"
+    epfile = mkdist(site, "foo-1.0.dist-info", "[console_scripts]\nfoo = foo:main\n")
+    expected = {
+        "foo": {
+            "console_scripts": {
+                "foo": EntryPoint("console_scripts", "foo", "foo", "main", ()),
+            },
+        },
+    }
+    assert scan_environment([site], cache=cache) == expected
+    data = json.loads(cache.read_text())
+    entry["stamp"] = data["files"][str(epfile)]["stamp"]
+    data["files"][str(epfile)] = entry
+    cache.write_text(json.dumps(data))
+    assert scan_environment([site], cache=cache) == expected
+    assert json.loads(cache.read_text())["files"][str(epfile)]["entry_points"] == [
+        ["console_scripts", "foo", "foo", "main", []]
+    ]
+
+
+def test_scan_environment_parse_error(tmp_path: Path) -> None:
+    epfile = mkdist(tmp_path, "foo-1.0.dist-info", "foo = foo:main\n")
+    with pytest.raises(ParseError) as excinfo:
+        scan_environment([tmp_path])
+    assert str(excinfo.value) == (
+        f"{epfile}: Entry point line occurs before any group headers"
+    )
+    assert isinstance(excinfo.value.__cause__, ParseError)
+
+
+def test_scan_environment_on_error(tmp_path: Path) -> None:
+    cache = tmp_path / "cache.json"
+    site = tmp_path / "site"
+    bad = mkdist(site, "bad-1.0.dist-info", "foo = foo:main\n")
+    mkdist(site, "good-1.0.dist-info", "[console_scripts]\nfoo = foo:main\n")
+    errors: list[tuple[str, ParseError]] = []
+    result = scan_environment(
+        [site], cache=cache, on_error=lambda p, e: errors.append((p, e))
+    )
+    assert list(result) == ["good"]
+    assert [(p, str(e)) for p, e in errors] == [
+        (str(bad), "Entry point line occurs before any group headers")
+    ]
+    assert list(json.loads(cache.read_text())["files"]) == [
+        str(site / "good-1.0.dist-info" / "entry_points.txt")
+    ]
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+import configparser
+from io import StringIO
+import threading
+from entry_points_txt import EntryPoint, EntryPointSet, dumps, load, loads
+
+N_THREADS = 8
+ITERATIONS = 200
+
+EPS: EntryPointSet = {
+    "console_scripts": {
+        f"cmd{i}": EntryPoint(
+            "console_scripts", f"cmd{i}", f"package.mod{i}", "main", ()
+        )
+        for i in range(25)
+    },
+    "thingy.extension": {
+        f"ext{i}": EntryPoint(
+            "thingy.extension", f"ext{i}", "package.thingy", None, ("xtr", "b-c")
+        )
+        for i in range(25)
+    },
+}
+
+TXT = dumps(EPS)
+
+
+def test_concurrent_roundtrip() -> None:
+    barrier = threading.Barrier(N_THREADS)
+
+    def work(_: int) -> bool:
+        barrier.wait()
+        for _ in range(ITERATIONS):
+            if loads(TXT) != EPS:
+                return False
+            if load(StringIO(TXT)) != EPS:
+                return False
+            if dumps(EPS) != TXT:
+                return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=N_THREADS) as pool:
+        assert all(pool.map(work, range(N_THREADS)))
+
+
+def test_concurrent_ep_load() -> None:
+    barrier = threading.Barrier(N_THREADS)
+    ep = EntryPoint("group", "foo", "configparser", "ConfigParser.BOOLEAN_STATES", ())
+
+    def work(_: int) -> bool:
+        barrier.wait()
+        return all(
+            ep.load() is configparser.ConfigParser.BOOLEAN_STATES
+            for _ in range(ITERATIONS)
+        )
+
+    with ThreadPoolExecutor(max_workers=N_THREADS) as pool:
+        assert all(pool.map(work, range(N_THREADS)))
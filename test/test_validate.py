@@ -0,0 +1,29 @@
+from entry_points_txt import (
+    validate_dotted_names,
+    validate_extras,
+    validate_group_names,
+)
+
+
+def test_validate_group_names() -> None:
+    assert validate_group_names(
+        ["console_scripts", "foo.bar", "", "foo.", "foo bar", "console_scripts"]
+    ) == ([True, True, False, False, False, True], [2, 3, 4])
+
+
+def test_validate_dotted_names() -> None:
+    assert validate_dotted_names(
+        ["foo", "foo.bar_baz", "foo.", "class", "foo.class", "1foo", "foo"]
+    ) == ([True, True, False, False, False, False, True], [2, 3, 4, 5])
+
+
+def test_validate_extras() -> None:
+    assert validate_extras(
+        ["xtr", "foo-bar.baz", "foo.", "", "-foo", "a", "xtr", "foo."]
+    ) == ([True, True, False, False, False, True, True, False], [2, 3, 4, 7])
+
+
+def test_validate_empty() -> None:
+    assert validate_group_names([]) == ([], [])
+    assert validate_dotted_names(iter([])) == ([], [])
+    assert validate_extras(()) == ([], [])
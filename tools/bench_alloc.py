@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Compare the memory allocated per line by `loads()` and `loads_tuples()` using
+`tracemalloc`::
+
+    python tools/bench_alloc.py
+    python tools/bench_alloc.py --lines 100000
+
+For each parsing path, this reports the peak traced memory while parsing and
+the memory still held by the result afterwards, both divided by the number of
+entry point lines.  `loads_tuples()` only avoids constructing `EntryPoint`
+objects; the intermediate strings created while splitting each line are the
+same for both paths.
+"""
+
+from __future__ import annotations
+import argparse
+from collections.abc import Callable
+import gc
+import tracemalloc
+from typing import Any
+from entry_points_txt import loads, loads_tuples
+
+
+def make_document(lines: int) -> str:
+    s = "[console_scripts]\n"
+    for i in range(lines):
+        s += f"cmd{i} = package.mod{i}:klass.main [xtr, b-c]\n"
+    return s
+
+
+def measure(func: Callable[[str], Any], txt: str) -> tuple[int, int]:
+    """
+    Return the peak traced memory while calling ``func(txt)`` and the traced
+    memory still in use by its result afterwards
+    """
+    func(txt)  # Warm up any lazily-initialized state
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func(txt)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-n",
+        "--lines",
+        type=int,
+        default=10000,
+        help="Number of entry point lines in the test document",
+    )
+    args = parser.parse_args()
+    txt = make_document(args.lines)
+    paths: list[tuple[str, Callable[[str], Any]]] = [
+        ("loads()", loads),
+        ("list(loads_tuples())", lambda s: list(loads_tuples(s))),
+        ("columns via zip()", lambda s: list(zip(*loads_tuples(s)))),
+    ]
+    print(f"{args.lines} lines\n")
+    print(f"{'path':<22}  {'peak B/line':>11}  {'retained B/line':>15}")
+    for label, func in paths:
+        peak, current = measure(func, txt)
+        print(
+            f"{label:<22}  {peak / args.lines:>11.0f}"
+            f"  {current / args.lines:>15.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
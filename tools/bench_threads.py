@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Measure the throughput of `loads()` & `dumps()` when run from varying numbers
+of threads.  Run this under both a regular and a free-threaded ("no-GIL")
+build of CPython to compare how the functions scale::
+
+    python tools/bench_threads.py
+    python3.13t tools/bench_threads.py --threads 1 2 4 8 16
+
+A fixed total amount of work is divided evenly among the threads, so on a
+build without a GIL the elapsed time should drop as threads are added, while
+with the GIL it should stay roughly flat.
+"""
+
+from __future__ import annotations
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
+import time
+from entry_points_txt import EntryPoint, EntryPointSet, dumps, loads
+
+EPS: EntryPointSet = {
+    "console_scripts": {
+        f"cmd{i}": EntryPoint(
+            "console_scripts", f"cmd{i}", f"package.mod{i}", "main", ()
+        )
+        for i in range(50)
+    },
+    "thingy.extension": {
+        f"ext{i}": EntryPoint(
+            "thingy.extension", f"ext{i}", "package.thingy", None, ("xtr", "b-c")
+        )
+        for i in range(50)
+    },
+}
+
+TXT = dumps(EPS)
+
+
+def run(nthreads: int, total: int) -> float:
+    """
+    Perform ``total`` `loads()`/`dumps()` round trips split across
+    ``nthreads`` threads and return the elapsed wall-clock time in seconds
+    """
+    per_thread = total // nthreads
+    barrier = threading.Barrier(nthreads + 1)
+
+    def work() -> None:
+        barrier.wait()
+        for _ in range(per_thread):
+            dumps(loads(TXT))
+
+    with ThreadPoolExecutor(max_workers=nthreads) as pool:
+        futures = [pool.submit(work) for _ in range(nthreads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for f in futures:
+            f.result()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-n",
+        "--total",
+        type=int,
+        default=4000,
+        help="Total number of round trips to perform per thread count",
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Thread counts to measure",
+    )
+    args = parser.parse_args()
+    if min(args.threads) < 1:
+        parser.error("thread counts must be positive")
+    if args.total < max(args.threads):
+        parser.error("--total must be at least the largest thread count")
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {is_gil_enabled()}")
+    print(f"{len(TXT.splitlines())} lines per document\n")
+    print(f"{'threads':>7}  {'seconds':>8}  {'docs/s':>9}  {'speedup':>7}")
+    baseline: float | None = None
+    for n in args.threads:
+        elapsed = run(n, args.total)
+        rate = (args.total // n) * n / elapsed
+        if baseline is None:
+            baseline = rate
+        print(f"{n:>7}  {elapsed:>8.3f}  {rate:>9.0f}  {rate / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()